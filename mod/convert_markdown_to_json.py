@@ -16,6 +16,9 @@ Usage:
     
     # Preview output without writing file:
     python convert_markdown_to_json.py --input file.md --preview
+    
+    # Measure time and memory for converting every guide under Guides/:
+    python convert_markdown_to_json.py --benchmark --base-path "."
 
 Output Format:
     The tool outputs JSON that can be added to descriptions.json:
@@ -29,9 +32,12 @@ Output Format:
 import re
 import json
 import os
+import time
+import tracemalloc
 import argparse
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
+from json.encoder import encode_basestring_ascii
 
 
 def slugify(text: str) -> str:
@@ -55,8 +61,12 @@ def extract_title_and_subtitle(content: str) -> Tuple[str, str]:
     return title, subtitle
 
 
-def parse_table(lines: List[str], start_idx: int) -> Tuple[List[Dict[str, List[str]]], int]:
-    """Parse a markdown table starting at the given line index."""
+def parse_table(lines: List[str], start_idx: int) -> Tuple[List[List[str]], int]:
+    """Parse a markdown table starting at the given line index.
+
+    Rows are returned as plain cell lists; they are written out as
+    ``{"cells": [...]}`` objects when the section is serialized.
+    """
     table_rows = []
     idx = start_idx
     
@@ -73,7 +83,7 @@ def parse_table(lines: List[str], start_idx: int) -> Tuple[List[Dict[str, List[s
         # Parse table row
         cells = [cell.strip() for cell in line.split('|')[1:-1]]
         if cells and not all(c.startswith('---') or c.startswith('-') for c in cells):
-            table_rows.append({"cells": cells})
+            table_rows.append(cells)
         idx += 1
     
     return table_rows, idx
@@ -143,14 +153,62 @@ def convert_markdown_formatting(text: str) -> str:
     return text
 
 
-def parse_section_content(lines: List[str], start_idx: int, end_idx: int) -> Dict[str, Any]:
-    """Parse content within a section (between headers)."""
-    content = {
-        "description": "",
-        "items": [],
-        "steps": [],
-        "table": []
-    }
+class Section:
+    """A single OperationalDetails section.
+
+    Uses ``__slots__`` and leaves empty fields as ``None`` so large
+    conversions don't allocate a dict per section (or per table row).
+    The node is filled in once while parsing and serialized directly to
+    the JSON shape expected by descriptions.json via ``write_json``.
+    """
+    __slots__ = ("title", "toc_id", "collapsible", "description",
+                 "items", "steps", "table", "children")
+
+    def __init__(self, title: str = "", toc_id: Optional[str] = None, collapsible: bool = True):
+        self.title = title
+        self.toc_id = toc_id
+        self.collapsible = collapsible
+        self.description = ""
+        self.items: Optional[List[str]] = None
+        self.steps: Optional[List[str]] = None
+        self.table: Optional[List[List[str]]] = None
+        self.children: Optional[List["Section"]] = None
+
+    def has_content(self) -> bool:
+        """True if the section has any body content (ignoring children)."""
+        return bool(self.description or self.items or self.steps or self.table)
+
+    def iter_fields(self):
+        """Yield (json_key, value) pairs in output order, skipping empty fields."""
+        yield "title", self.title
+        if self.toc_id is not None:
+            yield "tocId", self.toc_id
+        yield "collapsible", self.collapsible
+        if self.description:
+            yield "description", self.description
+        if self.items:
+            yield "items", self.items
+        if self.steps:
+            yield "steps", self.steps
+        if self.table:
+            yield "table", _TableRows(self.table)
+        if self.children is not None:
+            yield "children", self.children
+
+
+class _TableRows:
+    """Wraps raw table rows so they serialize as ``[{"cells": [...]}, ...]``."""
+    __slots__ = ("rows",)
+
+    def __init__(self, rows: List[List[str]]):
+        self.rows = rows
+
+
+def parse_section_content(lines: List[str], start_idx: int, end_idx: int,
+                          section: Optional[Section] = None) -> Section:
+    """Parse content within a section (between headers) into ``section``."""
+    if section is None:
+        section = Section()
     
     description_lines = []
     idx = start_idx
@@ -168,19 +226,21 @@ def parse_section_content(lines: List[str], start_idx: int, end_idx: int) -> Dic
         if stripped.startswith('|') and not stripped.startswith('|---'):
             table, idx = parse_table(lines, idx)
             if table:
-                content["table"] = table
+                section.table = table
             continue
         
         # Numbered list (steps)
         if re.match(r'^\d+\.\s+', stripped):
-            steps, idx = parse_numbered_list(lines, idx)
-            content["steps"] = steps
+            section.steps, idx = parse_numbered_list(lines, idx)
             continue
         
         # Bullet list
         if stripped.startswith('- ') or stripped.startswith('* '):
             items, idx = parse_list_items(lines, idx)
-            content["items"].extend(items)
+            if section.items is None:
+                section.items = items
+            else:
+                section.items.extend(items)
             continue
         
         # Code block - skip
@@ -199,17 +259,77 @@ def parse_section_content(lines: List[str], start_idx: int, end_idx: int) -> Dic
         
         idx += 1
     
-    content["description"] = "\n".join(description_lines).strip()
-    
-    # Clean up empty fields
-    if not content["items"]:
-        del content["items"]
-    if not content["steps"]:
-        del content["steps"]
-    if not content["table"]:
-        del content["table"]
+    section.description = "\n".join(description_lines).strip()
+    
+    return section
+
+
+def _iter_json(obj: Any, level: int, indent: str):
+    """Yield JSON text chunks for obj, matching json.dumps(obj, indent=...) output.
+
+    Understands Section nodes and table rows in addition to the usual JSON
+    types, so converted guides never have to be copied into dicts first.
+    """
+    if isinstance(obj, str):
+        yield encode_basestring_ascii(obj)
+        return
+    if obj is None or isinstance(obj, (bool, int, float)):
+        yield json.dumps(obj)
+        return
+    
+    if isinstance(obj, Section):
+        pairs = obj.iter_fields()
+    elif isinstance(obj, dict):
+        pairs = iter(obj.items())
+    elif isinstance(obj, _TableRows):
+        if not obj.rows:
+            yield '[]'
+            return
+        inner = '\n' + indent * (level + 1)
+        row_inner = inner + indent
+        yield '['
+        first = True
+        for row in obj.rows:
+            yield (inner if first else ',' + inner) + '{' + row_inner + '"cells": '
+            yield from _iter_json(row, level + 2, indent)
+            yield inner + '}'
+            first = False
+        yield '\n' + indent * level + ']'
+        return
+    elif isinstance(obj, (list, tuple)):
+        if not obj:
+            yield '[]'
+            return
+        inner = '\n' + indent * (level + 1)
+        yield '['
+        first = True
+        for value in obj:
+            yield inner if first else ',' + inner
+            yield from _iter_json(value, level + 1, indent)
+            first = False
+        yield '\n' + indent * level + ']'
+        return
+    else:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
     
-    return content
+    inner = '\n' + indent * (level + 1)
+    first = True
+    for key, value in pairs:
+        yield ('{' if first else ',') + inner + encode_basestring_ascii(key) + ': '
+        yield from _iter_json(value, level + 1, indent)
+        first = False
+    yield '{}' if first else '\n' + indent * level + '}'
+
+
+def write_json(obj: Any, fp, indent: int = 2) -> None:
+    """Stream obj (which may contain Section nodes) to a file as JSON."""
+    for chunk in _iter_json(obj, 0, ' ' * indent):
+        fp.write(chunk)
+
+
+def to_json(obj: Any, indent: int = 2) -> str:
+    """Serialize obj (which may contain Section nodes) to a JSON string."""
+    return ''.join(_iter_json(obj, 0, ' ' * indent))
 
 
 def find_sections(content: str) -> List[Dict[str, Any]]:
@@ -241,7 +361,10 @@ def find_sections(content: str) -> List[Dict[str, Any]]:
 
 
 def convert_to_guide_format(content: str, guide_key: str) -> Dict[str, Any]:
-    """Convert markdown to heavily nested guide format with collapsible sections."""
+    """Convert markdown to heavily nested guide format with collapsible sections.
+
+    OperationalDetails holds Section nodes; serialize with to_json/write_json.
+    """
     title, subtitle = extract_title_and_subtitle(content)
     lines = content.split('\n')
     sections = find_sections(content)
@@ -258,7 +381,7 @@ def convert_to_guide_format(content: str, guide_key: str) -> Dict[str, Any]:
     }
     
     # Build hierarchical structure
-    def build_section(section_info: Dict, section_idx: int, all_sections: List[Dict], lines: List[str]) -> Dict[str, Any]:
+    def build_section(section_info: Dict, section_idx: int, all_sections: List[Dict], lines: List[str]) -> Section:
         """Build a section with its children."""
         start_line = section_info["line_idx"] + 1
         
@@ -281,30 +404,16 @@ def convert_to_guide_format(content: str, guide_key: str) -> Dict[str, Any]:
             content_end = end_line
         
         # Parse content for this section
-        section_content = parse_section_content(lines, start_line, content_end)
-        
-        result = {
-            "title": section_info["title"],
-            "tocId": slugify(section_info["title"]),
-            "collapsible": True
-        }
-        
-        if section_content.get("description"):
-            result["description"] = section_content["description"]
-        if section_content.get("items"):
-            result["items"] = section_content["items"]
-        if section_content.get("steps"):
-            result["steps"] = section_content["steps"]
-        if section_content.get("table"):
-            result["table"] = section_content["table"]
+        result = Section(section_info["title"], slugify(section_info["title"]))
+        parse_section_content(lines, start_line, content_end, result)
         
         # Process children
         if children_sections:
-            result["children"] = []
+            result.children = []
             for child_info, child_idx in children_sections:
                 # Check if this child belongs to us (before next sibling)
                 child_result = build_section(child_info, child_idx, all_sections, lines)
-                result["children"].append(child_result)
+                result.children.append(child_result)
         
         return result
     
@@ -319,7 +428,10 @@ def convert_to_guide_format(content: str, guide_key: str) -> Dict[str, Any]:
 
 
 def convert_to_mechanics_format(content: str, guide_key: str) -> Dict[str, Any]:
-    """Convert markdown to flat game mechanics format with tables and minimal nesting."""
+    """Convert markdown to flat game mechanics format with tables and minimal nesting.
+
+    OperationalDetails holds Section nodes; serialize with to_json/write_json.
+    """
     title, subtitle = extract_title_and_subtitle(content)
     lines = content.split('\n')
     sections = find_sections(content)
@@ -342,7 +454,7 @@ def convert_to_mechanics_format(content: str, guide_key: str) -> Dict[str, Any]:
     # For mechanics, we process ONLY H3 sections directly (skip H2 headers)
     # This gives us a flat list of topics with their tables
     
-    def build_flat_section(section_info: Dict, section_idx: int, all_sections: List[Dict], lines: List[str]) -> Dict[str, Any]:
+    def build_flat_section(section_info: Dict, section_idx: int, all_sections: List[Dict], lines: List[str]) -> Section:
         """Build a flattened section for mechanics pages."""
         start_line = section_info["line_idx"] + 1
         
@@ -355,26 +467,12 @@ def convert_to_mechanics_format(content: str, guide_key: str) -> Dict[str, Any]:
                 break
         
         # Parse content
-        section_content = parse_section_content(lines, start_line, end_line)
-        
-        result = {
-            "title": section_info["title"],
-            "tocId": slugify(section_info["title"]),
-            "collapsible": True
-        }
+        result = Section(section_info["title"], slugify(section_info["title"]))
+        parse_section_content(lines, start_line, end_line, result)
         
         # Clean up description - remove "---" markers
-        desc = section_content.get("description", "")
-        desc = desc.replace("\n\n---", "").replace("---\n\n", "").replace("---", "").strip()
-        
-        if desc:
-            result["description"] = desc
-        if section_content.get("items"):
-            result["items"] = section_content["items"]
-        if section_content.get("steps"):
-            result["steps"] = section_content["steps"]
-        if section_content.get("table"):
-            result["table"] = section_content["table"]
+        desc = result.description
+        result.description = desc.replace("\n\n---", "").replace("---\n\n", "").replace("---", "").strip()
         
         return result
     
@@ -383,7 +481,7 @@ def convert_to_mechanics_format(content: str, guide_key: str) -> Dict[str, Any]:
         if section["level"] == 3:
             result = build_flat_section(section, i, sections, lines)
             # Skip empty sections
-            if result.get("description") or result.get("items") or result.get("steps") or result.get("table"):
+            if result.has_content():
                 mechanic["OperationalDetails"].append(result)
     
     return mechanic
@@ -402,7 +500,11 @@ def generate_guide_key(filename: str, is_mechanic: bool = False) -> str:
 
 
 def process_markdown_file(filepath: str, output_type: str = "auto") -> Dict[str, Any]:
-    """Process a single markdown file and return the JSON structure."""
+    """Process a single markdown file and return the JSON structure.
+
+    The result contains Section nodes, so it must be serialized with
+    to_json/write_json rather than json.dumps.
+    """
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
     
@@ -425,7 +527,10 @@ def process_markdown_file(filepath: str, output_type: str = "auto") -> Dict[str,
 
 
 def convert_all_to_be_implemented(base_path: str) -> Tuple[List[Dict], List[Dict]]:
-    """Convert all markdown files in the To Be Implemented folder."""
+    """Convert all markdown files in the To Be Implemented folder.
+
+    Entries contain Section nodes; serialize with to_json/write_json.
+    """
     guides_path = Path(base_path) / "Guides" / "To Be Implemented" / "Guides"
     mechanics_path = Path(base_path) / "Guides" / "To Be Implemented" / "Game Mechanics"
     
@@ -449,6 +554,46 @@ def convert_all_to_be_implemented(base_path: str) -> Tuple[List[Dict], List[Dict
     return guides, mechanics
 
 
+def benchmark_conversion(base_path: str) -> Dict[str, Any]:
+    """Convert every markdown file under Guides/ and measure time and memory.
+
+    Peak memory and block counts come from tracemalloc; "retained blocks" is
+    the number of allocations still alive once conversion has finished, i.e.
+    what the converted section trees cost to hold in memory.
+    """
+    md_files = sorted((Path(base_path) / "Guides").rglob("*.md"))
+    
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    
+    results = [process_markdown_file(str(md_file)) for md_file in md_files]
+    
+    convert_time = time.perf_counter() - start
+    _, convert_peak = tracemalloc.get_traced_memory()
+    retained = tracemalloc.take_snapshot().compare_to(baseline, "filename")
+    retained_blocks = sum(stat.count_diff for stat in retained)
+    retained_bytes = sum(stat.size_diff for stat in retained)
+    
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    with open(os.devnull, 'w', encoding='utf-8') as f:
+        write_json({"guides": results}, f)
+    serialize_time = time.perf_counter() - start
+    _, serialize_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {
+        "files": len(md_files),
+        "convert_seconds": convert_time,
+        "convert_peak_bytes": convert_peak,
+        "retained_blocks": retained_blocks,
+        "retained_bytes": retained_bytes,
+        "serialize_seconds": serialize_time,
+        "serialize_peak_bytes": serialize_peak,
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(description="Convert markdown to Stationpedia JSON format")
     parser.add_argument("--type", choices=["mechanics", "guide", "auto"], default="auto",
@@ -461,10 +606,21 @@ def main():
                        help="Base path to the mod folder")
     parser.add_argument("--preview", action="store_true",
                        help="Print JSON to stdout instead of writing to file")
+    parser.add_argument("--benchmark", action="store_true",
+                       help="Convert every guide under --base-path and report time, peak memory and allocations")
     
     args = parser.parse_args()
     
-    if args.convert_all:
+    if args.benchmark:
+        stats = benchmark_conversion(args.base_path)
+        print(f"Files converted:      {stats['files']}")
+        print(f"Convert time:         {stats['convert_seconds'] * 1000:.1f} ms")
+        print(f"Convert peak memory:  {stats['convert_peak_bytes'] / 1024:.1f} KiB")
+        print(f"Retained allocations: {stats['retained_blocks']} blocks ({stats['retained_bytes'] / 1024:.1f} KiB)")
+        print(f"Serialize time:       {stats['serialize_seconds'] * 1000:.1f} ms")
+        print(f"Serialize peak memory: {stats['serialize_peak_bytes'] / 1024:.1f} KiB")
+    
+    elif args.convert_all:
         guides, mechanics = convert_all_to_be_implemented(args.base_path)
         
         output = {
@@ -473,11 +629,11 @@ def main():
         }
         
         if args.preview:
-            print(json.dumps(output, indent=2))
+            print(to_json(output))
         else:
             output_file = args.output or "converted_entries.json"
             with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(output, f, indent=2)
+                write_json(output, f)
             print(f"\nConverted {len(guides)} guides and {len(mechanics)} mechanics")
             print(f"Output written to: {output_file}")
             print("\nTo add these to descriptions.json:")
@@ -489,11 +645,11 @@ def main():
         result = process_markdown_file(args.input, args.type)
         
         if args.preview:
-            print(json.dumps(result, indent=2))
+            print(to_json(result))
         else:
             output_file = args.output or f"{Path(args.input).stem}.json"
             with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2)
+                write_json(result, f)
             print(f"Output written to: {output_file}")
     
     else:
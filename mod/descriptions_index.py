@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Single-entry access to descriptions.json
+
+Keeps a byte-offset index of the top-level entries in descriptions.json
+(deviceKey / guideKey -> byte span) so one entry can be read, replaced or
+removed without loading and re-dumping the whole file. Everything outside
+the touched entry is preserved byte-for-byte, so edits produce small diffs.
+
+The index is cached next to the file (descriptions.json.index) and is rebuilt
+automatically whenever the file's size or modification time no longer match.
+
+Usage:
+    # Print one entry:
+    python descriptions_index.py get ThingStructureSolidFuelGenerator
+
+    # Replace an entry (or append it if the key is new) from a JSON file or stdin:
+    python descriptions_index.py put --input entry.json
+    python descriptions_index.py put --section mechanics < entry.json
+
+    # Remove an entry:
+    python descriptions_index.py delete GuideStirlingEngineGuide
+
+    # Force an index rebuild:
+    python descriptions_index.py rebuild
+
+Python API:
+    index = DescriptionsIndex("descriptions.json")
+    entry = index.get("ThingStructureSolidFuelGenerator")
+    index.put(entry)
+    index.delete("ThingStructureSolidFuelGenerator")
+"""
+
+import json
+import os
+import sys
+import argparse
+from json.decoder import WHITESPACE
+from typing import Dict, List, Any, Optional, Tuple
+
+
+# Top-level arrays that hold keyed entries, and the key field for each
+ENTRY_SECTIONS = {
+    "devices": "deviceKey",
+    "guides": "guideKey",
+    "mechanics": "guideKey",
+}
+
+INDEX_SUFFIX = ".index"
+INDEX_VERSION = 2
+
+_decoder = json.JSONDecoder()
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    return WHITESPACE.match(text, pos).end()
+
+
+def _expect(text: str, pos: int, char: str) -> int:
+    if text[pos:pos + 1] != char:
+        raise ValueError(f"Expected '{char}' at byte {pos}, found {text[pos:pos + 1]!r}")
+    return pos + 1
+
+
+def _fix_key(key: str) -> str:
+    """Undo the latin-1 decoding used for scanning on a non-ASCII key."""
+    if key.isascii():
+        return key
+    try:
+        return key.encode("latin-1").decode("utf-8")
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return key
+
+
+def scan_entries(data: bytes) -> Dict[str, Any]:
+    """Scan descriptions.json bytes and return the span of every keyed entry.
+
+    The bytes are decoded as latin-1 so string offsets equal byte offsets;
+    the C JSON decoder is then used to step over each value.
+    Returns {"arrays": {section: [open, close]}, "entries": {section: [[key, start, end], ...]}}
+    where open/close are the offsets of the array's brackets and end is exclusive.
+    Every array element is recorded, so splices always use the real neighbours;
+    elements without a string key field get a key of None.
+    """
+    text = data.decode("latin-1")
+    arrays: Dict[str, List[int]] = {}
+    entries: Dict[str, List[List[Any]]] = {}
+
+    pos = _expect(text, _skip_ws(text, 0), "{")
+    pos = _skip_ws(text, pos)
+    if text[pos:pos + 1] == "}":
+        return {"arrays": arrays, "entries": entries}
+
+    while True:
+        name, pos = _decoder.raw_decode(text, pos)
+        pos = _skip_ws(text, _expect(text, _skip_ws(text, pos), ":"))
+
+        if name in ENTRY_SECTIONS and text[pos:pos + 1] == "[":
+            key_field = ENTRY_SECTIONS[name]
+            section_entries = []
+            open_pos = pos
+            pos = _skip_ws(text, pos + 1)
+            if text[pos:pos + 1] != "]":
+                while True:
+                    entry, end = _decoder.raw_decode(text, pos)
+                    key = entry.get(key_field) if isinstance(entry, dict) else None
+                    key = _fix_key(key) if isinstance(key, str) else None
+                    section_entries.append([key, pos, end])
+                    pos = _skip_ws(text, end)
+                    if text[pos:pos + 1] == "]":
+                        break
+                    pos = _skip_ws(text, _expect(text, pos, ","))
+            arrays[name] = [open_pos, pos]
+            entries[name] = section_entries
+            pos += 1
+        else:
+            _, pos = _decoder.raw_decode(text, pos)
+
+        pos = _skip_ws(text, pos)
+        if text[pos:pos + 1] == "}":
+            break
+        pos = _skip_ws(text, _expect(text, pos, ","))
+
+    return {"arrays": arrays, "entries": entries}
+
+
+class DescriptionsIndex:
+    """Byte-offset index over the keyed entries of a descriptions.json file."""
+
+    def __init__(self, path: str, index_path: Optional[str] = None):
+        self.path = path
+        self.index_path = index_path or path + INDEX_SUFFIX
+        self.arrays: Dict[str, List[int]] = {}
+        self.entries: Dict[str, List[List[Any]]] = {}
+        self._stamp: Tuple[int, int] = (-1, -1)
+
+    # -- index maintenance -------------------------------------------------
+
+    def _file_stamp(self) -> Tuple[int, int]:
+        st = os.stat(self.path)
+        return st.st_size, st.st_mtime_ns
+
+    def refresh(self) -> None:
+        """Make sure the index matches the file, loading or rebuilding it as needed."""
+        stamp = self._file_stamp()
+        if stamp == self._stamp:
+            return
+        if not self._load(stamp):
+            self.rebuild()
+
+    def _load(self, stamp: Tuple[int, int]) -> bool:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if cached.get("version") != INDEX_VERSION or (cached.get("size"), cached.get("mtime_ns")) != stamp:
+            return False
+        self.arrays = cached["arrays"]
+        self.entries = cached["entries"]
+        self._stamp = stamp
+        return True
+
+    def rebuild(self) -> None:
+        """Rescan the whole file and rewrite the cached index."""
+        with open(self.path, "rb") as f:
+            scanned = scan_entries(f.read())
+        self.arrays = scanned["arrays"]
+        self.entries = scanned["entries"]
+        self._save()
+
+    def _save(self) -> None:
+        self._stamp = self._file_stamp()
+        cached = {
+            "version": INDEX_VERSION,
+            "size": self._stamp[0],
+            "mtime_ns": self._stamp[1],
+            "arrays": self.arrays,
+            "entries": self.entries,
+        }
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump(cached, f, ensure_ascii=False)
+
+    def _find(self, key: str, section: Optional[str] = None) -> Optional[Tuple[str, int]]:
+        """Return (section, position in that section) for key, or None."""
+        sections = [section] if section else list(self.entries)
+        for name in sections:
+            for i, (entry_key, _, _) in enumerate(self.entries.get(name, [])):
+                if entry_key == key:
+                    return name, i
+        return None
+
+    def _checked(self, name: str, i: int) -> Optional[bytes]:
+        """Return the bytes of entries[name][i] if they still hold that entry, else None.
+
+        Guards against outside edits the (size, mtime) stamp can miss; costs O(entry).
+        """
+        key, start, end = self.entries[name][i]
+        raw = self._read(start, end)
+        if not raw.startswith(b"{"):
+            return None
+        try:
+            entry = json.loads(raw)
+        except ValueError:
+            return None
+        found = entry.get(ENTRY_SECTIONS[name]) if isinstance(entry, dict) else None
+        return raw if (found if isinstance(found, str) else None) == key else None
+
+    def _locate(self, key: str, section: Optional[str] = None) -> Optional[Tuple[str, int, bytes]]:
+        """Find key and verify its span, rebuilding the index once if it is stale."""
+        self.refresh()
+        found = self._find(key, section)
+        if found is None:
+            return None
+        raw = self._checked(*found)
+        if raw is None:
+            self.rebuild()
+            found = self._find(key, section)
+            if found is None:
+                return None
+            raw = self._checked(*found)
+            if raw is None:
+                raise ValueError(f"Could not read entry '{key}' from {self.path}")
+        return found[0], found[1], raw
+
+    def _append_site_ok(self, name: str) -> bool:
+        """Check that the array's closing bracket and last element are where the index says."""
+        if name not in self.arrays:
+            return True
+        close_pos = self.arrays[name][1]
+        if self._read(close_pos, close_pos + 1) != b"]":
+            return False
+        return not self.entries[name] or self._checked(name, len(self.entries[name]) - 1) is not None
+
+    def _shift(self, after: int, delta: int) -> None:
+        """Move every recorded offset at or beyond `after` by delta bytes."""
+        if not delta:
+            return
+        for span in self.arrays.values():
+            for j in (0, 1):
+                if span[j] >= after:
+                    span[j] += delta
+        for section_entries in self.entries.values():
+            for record in section_entries:
+                if record[1] >= after:
+                    record[1] += delta
+                if record[2] >= after:
+                    record[2] += delta
+
+    # -- file access -------------------------------------------------------
+
+    def _read(self, start: int, end: int) -> bytes:
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            return f.read(end - start)
+
+    def _splice(self, start: int, end: int, replacement: bytes) -> None:
+        """Replace bytes [start, end) in place; only the tail after `end` is moved."""
+        delta = len(replacement) - (end - start)
+        with open(self.path, "r+b") as f:
+            if delta:
+                f.seek(end)
+                tail = f.read()
+                f.seek(start)
+                f.write(replacement)
+                f.write(tail)
+                f.truncate()
+            else:
+                f.seek(start)
+                f.write(replacement)
+        self._shift(end, delta)
+
+    def _line_indent(self, pos: int) -> str:
+        """Return the whitespace that precedes pos on its line."""
+        line_start = max(0, pos - 256)
+        prefix = self._read(line_start, pos).decode("utf-8", errors="replace")
+        line = prefix.rsplit("\n", 1)[-1]
+        return line[:len(line) - len(line.lstrip())]
+
+    @staticmethod
+    def _encode(entry: Dict[str, Any], indent: str, unit: int) -> bytes:
+        text = json.dumps(entry, indent=unit, ensure_ascii=False)
+        return text.replace("\n", "\n" + indent).encode("utf-8")
+
+    # -- public API --------------------------------------------------------
+
+    def keys(self, section: Optional[str] = None) -> List[str]:
+        """List entry keys, optionally limited to one section."""
+        self.refresh()
+        sections = [section] if section else list(self.entries)
+        return [record[0] for name in sections for record in self.entries.get(name, [])
+                if record[0] is not None]
+
+    def get_raw(self, key: str, section: Optional[str] = None) -> Optional[bytes]:
+        """Return the exact bytes of an entry, or None if it isn't present."""
+        found = self._locate(key, section)
+        return found[2] if found is not None else None
+
+    def get(self, key: str, section: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return the parsed entry, or None if it isn't present."""
+        raw = self.get_raw(key, section)
+        return json.loads(raw) if raw is not None else None
+
+    def put(self, entry: Dict[str, Any], section: Optional[str] = None) -> str:
+        """Replace the entry with the same key, or append it to its section.
+
+        The section defaults to "devices" for deviceKey entries and "guides"
+        for guideKey entries when the key isn't already in the file. Raises
+        ValueError if the key already exists in a section other than `section`.
+        Returns "updated" or "added".
+        """
+        if not isinstance(entry, dict):
+            raise ValueError(f"Entry must be a JSON object, not {type(entry).__name__}")
+        if "deviceKey" in entry:
+            key = entry["deviceKey"]
+        elif "guideKey" in entry:
+            key = entry["guideKey"]
+        else:
+            raise ValueError("Entry must have a deviceKey or guideKey")
+        if not isinstance(key, str):
+            raise ValueError("deviceKey/guideKey must be a string")
+
+        # Look in every section so a key is never duplicated across arrays
+        found = self._locate(key)
+        if found is not None and section and found[0] != section:
+            raise ValueError(f"'{key}' already exists in '{found[0]}', not '{section}'")
+        name = found[0] if found is not None else section or ("devices" if "deviceKey" in entry else "guides")
+        if name in ENTRY_SECTIONS and entry.get(ENTRY_SECTIONS[name]) != key:
+            raise ValueError(f"Entries in '{name}' are keyed by {ENTRY_SECTIONS[name]}")
+        if found is not None:
+            name, i, _ = found
+            record = self.entries[name][i]
+            indent = self._line_indent(record[1])
+            unit = max(1, len(indent) // 2) if indent.strip(" ") == "" else 2
+            data = self._encode(entry, indent, unit)
+            self._splice(record[1], record[2], data)
+            record[2] = record[1] + len(data)
+            self._save()
+            return "updated"
+
+        if not self._append_site_ok(name):
+            self.rebuild()
+        if name not in self.arrays:
+            raise KeyError(f"Section '{name}' not found in {self.path}")
+        open_pos, close_pos = self.arrays[name]
+        section_entries = self.entries[name]
+        array_indent = self._line_indent(open_pos)
+        if section_entries:
+            last_start, last_end = section_entries[-1][1], section_entries[-1][2]
+            indent = self._line_indent(last_start)
+            unit = max(1, len(indent) // 2) if indent.strip(" ") == "" else 2
+            data = self._encode(entry, indent, unit)
+            # Reuse the separator already between the array's entries
+            if len(section_entries) > 1:
+                separator = self._read(section_entries[-2][2], last_start)
+            else:
+                separator = b",\n" + indent.encode("utf-8")
+            self._splice(last_end, last_end, separator + data)
+            # The splice shifted the previous entry's end along with the insert
+            section_entries[-1][2] = last_end
+            start = last_end + len(separator)
+        else:
+            unit = 2
+            indent = array_indent + " " * unit
+            data = self._encode(entry, indent, unit)
+            prefix = b"\n" + indent.encode("utf-8")
+            self._splice(open_pos + 1, close_pos, prefix + data + b"\n" + array_indent.encode("utf-8"))
+            start = open_pos + 1 + len(prefix)
+        section_entries.append([key, start, start + len(data)])
+        self._save()
+        return "added"
+
+    def delete(self, key: str, section: Optional[str] = None) -> bool:
+        """Remove an entry and its separator. Returns False if it wasn't found."""
+        found = self._locate(key, section)
+        if found is None:
+            return False
+        name, i, _ = found
+        # The neighbour bounding the splice must be current as well
+        neighbour = i - 1 if i > 0 else i + 1
+        if neighbour < len(self.entries[name]) and self._checked(name, neighbour) is None:
+            self.rebuild()
+            found = self._locate(key, section)
+            if found is None:
+                return False
+            name, i, _ = found
+        section_entries = self.entries[name]
+        _, start, end = section_entries[i]
+        if i > 0:
+            # Drop the separator before this entry along with it
+            start = section_entries[i - 1][2]
+        elif len(section_entries) > 1:
+            end = section_entries[i + 1][1]
+        else:
+            open_pos, close_pos = self.arrays[name]
+            start, end = open_pos + 1, close_pos
+        del section_entries[i]
+        self._splice(start, end, b"")
+        self._save()
+        return True
+
+
+def main():
+    default_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "descriptions.json")
+
+    parser = argparse.ArgumentParser(description="Read or edit single entries in descriptions.json")
+    parser.add_argument("--file", "-f", default=default_path,
+                       help="Path to descriptions.json")
+    parser.add_argument("--section", choices=list(ENTRY_SECTIONS),
+                       help="Limit lookups to one top-level array")
+    sub = parser.add_subparsers(dest="command")
+
+    # Also accept --section after the command; SUPPRESS keeps a value given
+    # before the command from being reset to None by the subparser.
+    section_parent = argparse.ArgumentParser(add_help=False)
+    section_parent.add_argument("--section", choices=list(ENTRY_SECTIONS), default=argparse.SUPPRESS,
+                       help="Limit lookups to one top-level array")
+
+    get_parser = sub.add_parser("get", parents=[section_parent], help="Print one entry exactly as stored")
+    get_parser.add_argument("key", help="deviceKey or guideKey")
+
+    put_parser = sub.add_parser("put", parents=[section_parent], help="Replace or append an entry")
+    put_parser.add_argument("--input", "-i", help="JSON file with the entry (default: stdin)")
+
+    delete_parser = sub.add_parser("delete", parents=[section_parent], help="Remove an entry")
+    delete_parser.add_argument("key", help="deviceKey or guideKey")
+
+    sub.add_parser("list", parents=[section_parent], help="List all entry keys")
+    sub.add_parser("rebuild", help="Rebuild the byte-offset index")
+
+    args = parser.parse_args()
+    index = DescriptionsIndex(args.file)
+
+    if args.command == "get":
+        raw = index.get_raw(args.key, args.section)
+        if raw is None:
+            print(f"Entry not found: {args.key}", file=sys.stderr)
+            sys.exit(1)
+        # Write the stored bytes untouched; the console encoding may not be UTF-8
+        sys.stdout.flush()
+        sys.stdout.buffer.write(raw + b"\n")
+
+    elif args.command == "put":
+        # utf-8-sig tolerates the BOM some Windows editors add
+        try:
+            if args.input:
+                with open(args.input, "r", encoding="utf-8-sig") as f:
+                    entry = json.load(f)
+            else:
+                entry = json.loads(sys.stdin.buffer.read().decode("utf-8-sig"))
+            result = index.put(entry, args.section)
+        except (KeyError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"{result.capitalize()} {entry.get('deviceKey') or entry.get('guideKey')}")
+
+    elif args.command == "delete":
+        if not index.delete(args.key, args.section):
+            print(f"Entry not found: {args.key}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Deleted {args.key}")
+
+    elif args.command == "list":
+        for key in index.keys(args.section):
+            print(key)
+
+    elif args.command == "rebuild":
+        index.rebuild()
+        total = len(index.keys())
+        print(f"Indexed {total} entries in {len(index.entries)} sections")
+
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()